@@ -9,14 +9,14 @@ and shows various analysis options.
 from alabama_autism_disparities_mapper import AlabamaAutismDisparitiesMapper
 import pandas as pd
 
-def example_basic_analysis():
+def example_basic_analysis(mapper=None):
     """
     Example of basic analysis using default settings.
     """
     print("=== Basic Analysis Example ===")
     
     # Initialize mapper with default settings
-    mapper = AlabamaAutismDisparitiesMapper()
+    mapper = mapper or AlabamaAutismDisparitiesMapper()
     
     # Run complete analysis
     map_obj, analysis_df = mapper.run_analysis()
@@ -49,13 +49,13 @@ def example_custom_data_path():
         processed_df = custom_mapper.process_autism_data(autism_df)
         print(f"Processed {len(processed_df)} provider records")
 
-def example_demographic_analysis():
+def example_demographic_analysis(mapper=None):
     """
     Example focusing on demographic analysis.
     """
     print("\n=== Demographic Analysis Example ===")
     
-    mapper = AlabamaAutismDisparitiesMapper()
+    mapper = mapper or AlabamaAutismDisparitiesMapper()
     
     # Get demographic data only
     demographic_data = mapper.get_demographic_data()
@@ -67,13 +67,13 @@ def example_demographic_analysis():
             if 'Population' in df.columns:
                 print(f"  Total population: {df['Population'].sum():,}")
 
-def example_map_creation():
+def example_map_creation(mapper=None):
     """
     Example of creating maps with custom settings.
     """
     print("\n=== Custom Map Creation Example ===")
     
-    mapper = AlabamaAutismDisparitiesMapper()
+    mapper = mapper or AlabamaAutismDisparitiesMapper()
     
     # Load data
     autism_df = mapper.load_autism_data()
@@ -94,13 +94,13 @@ def example_map_creation():
     map_obj.save('custom_alabama_autism_map.html')
     print("Custom map saved as 'custom_alabama_autism_map.html'")
 
-def example_statistical_analysis():
+def example_statistical_analysis(mapper=None):
     """
     Example of statistical analysis and correlation testing.
     """
     print("\n=== Statistical Analysis Example ===")
     
-    mapper = AlabamaAutismDisparitiesMapper()
+    mapper = mapper or AlabamaAutismDisparitiesMapper()
     
     # Load and process data
     autism_df = mapper.load_autism_data()
@@ -150,11 +150,14 @@ def main():
     print("=" * 50)
     
     try:
+        # Share one mapper so data loaded by the first example is reused
+        mapper = AlabamaAutismDisparitiesMapper()
+        
         # Run examples
-        example_basic_analysis()
-        example_demographic_analysis()
-        example_map_creation()
-        example_statistical_analysis()
+        example_basic_analysis(mapper)
+        example_demographic_analysis(mapper)
+        example_map_creation(mapper)
+        example_statistical_analysis(mapper)
         
         print("\n" + "=" * 50)
         print("All examples completed successfully!")